@@ -15,12 +15,26 @@ import sys
 import math
 import random
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from array import array
 from typing import List, Optional, Tuple
 
+try:
+    import numpy as np
+except ImportError:  # optional: gradients and tones fall back to plain loops
+    np = None
+
+# pygame-ce ships a SIMD box blur in transform; stock pygame does not
+_ce_box_blur = getattr(pygame.transform, 'box_blur', None)
+
 # ====== Configuration / Defaults ======
 DEFAULT_WIDTH, DEFAULT_HEIGHT = 900, 700
 FPS = 60
+# no SCALED: the layout is responsive and should track the real window size
+DISPLAY_FLAGS = pygame.RESIZABLE | pygame.DOUBLEBUF
+# longest the loop sleeps on the event queue while nothing is animating
+IDLE_WAIT_MS = 100
 
 # Marks
 PLAYER_X = 'X'
@@ -33,6 +47,25 @@ WIN_COMBINATIONS = [
     (0, 4, 8), (2, 4, 6)
 ]
 
+# Bitboards: bit i set <=> cell i holds the mark
+FULL_BOARD = 0x1FF
+WIN_MASKS = (
+    0b000000111, 0b000111000, 0b111000000,
+    0b001001001, 0b010010010, 0b100100100,
+    0b100010001, 0b001010100
+)
+
+# Child ordering for the search: center, corners, then edges
+MOVE_ORDER = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+# same ordering with a known best move (from the transposition table) tried first
+MOVE_ORDER_FROM = {m: (m,) + tuple(i for i in MOVE_ORDER if i != m) for m in range(9)}
+
+# Wall-clock budget (seconds) for one iterative-deepening search
+AI_TIME_BUDGET = 0.2
+
+# Transposition table bound flags
+TT_EXACT, TT_LOWER, TT_UPPER = 0, 1, 2
+
 
 # ====== Audio helpers ======
 def setup_audio():
@@ -50,8 +83,14 @@ def make_tone(freq=440.0, duration=0.25, volume=0.18, sample_rate=44100):
     """
     try:
         n = int(sample_rate * duration)
-        arr = array('h')
         amp = int(32767 * volume)
+        if np is not None:
+            # whole buffer in one vectorized pass
+            t = np.arange(n, dtype=np.float64) / sample_rate
+            wave = (amp * np.sin(2.0 * np.pi * freq * t)).astype(np.int16)
+            stereo = np.repeat(wave[:, None], 2, axis=1)
+            return pygame.mixer.Sound(buffer=stereo.tobytes())
+        arr = array('h')
         for i in range(n):
             t = float(i) / sample_rate
             v = int(amp * math.sin(2.0 * math.pi * freq * t))
@@ -63,6 +102,130 @@ def make_tone(freq=440.0, duration=0.25, volume=0.18, sample_rate=44100):
         return None
 
 
+# ====== Render helpers ======
+MARK_ANIM_MS = 420.0
+MARK_ANIM_FRAMES = 16
+
+
+def build_mark_frames(font, mark, color, frames=MARK_ANIM_FRAMES):
+    """
+    Pre-render the appear animation of a mark.
+    Frame k is the glyph at t = k / (frames - 1); the last one is full size.
+    """
+    base = to_display(font.render(mark, True, color))
+    w, h = base.get_size()
+    out = []
+    for k in range(frames - 1):
+        t = k / (frames - 1)
+        scale = 0.6 + 0.4 * t
+        frame = pygame.transform.smoothscale(base, (int(w * scale), int(h * scale)))
+        frame.set_alpha(int(255 * t))
+        out.append(frame)
+    out.append(base)
+    return out
+
+
+def vertical_gradient(size, color_a, color_b, alpha=False):
+    """
+    Build a top-to-bottom gradient surface from color_a to color_b.
+    With alpha=True the surface is SRCALPHA and the alpha channel is blended too.
+    Uses numpy when available, otherwise draws one line per row.
+    """
+    w, h = size
+    surf = pygame.Surface((w, h), pygame.SRCALPHA) if alpha else pygame.Surface((w, h))
+    if np is not None:
+        t = np.linspace(0.0, 1.0, h)[:, None]
+        strip = (np.array(color_a, dtype=np.float64) * (1 - t)
+                 + np.array(color_b, dtype=np.float64) * t + 0.5).astype(np.uint8)
+        arr = np.broadcast_to(strip[:, None, :3], (h, w, 3))
+        pygame.surfarray.blit_array(surf, arr.swapaxes(0, 1))
+        if alpha:
+            pygame.surfarray.pixels_alpha(surf)[:] = strip[None, :, 3]
+        return surf
+    for y in range(h):
+        t = y / max(1, h - 1)
+        pygame.draw.line(surf, color_a.lerp(color_b, t), (0, y), (w, y))
+    return surf
+
+
+def rounded_rect_surface(size, color, radius):
+    """
+    Build an SRCALPHA rounded rectangle of the given size, nine-slice style.
+    Only a (2*radius+1)-square tile is rasterized. Its corners are copied,
+    its middle rows/columns are stretched into the edges, and the center is
+    a flat fill. The result matches draw.rect(..., border_radius=radius) pixel
+    for pixel.
+    """
+    w, h = size
+    r = radius
+    k = 2 * r + 1
+    tile = pygame.Surface((k, k), pygame.SRCALPHA)
+    pygame.draw.rect(tile, color, tile.get_rect(), border_radius=r)
+    out = pygame.Surface((w, h), pygame.SRCALPHA)
+    # onto the empty surface, RGBA_MAX copies pixels instead of alpha-blending them
+    flags = pygame.BLEND_RGBA_MAX
+    for sx, dx in ((0, 0), (r + 1, w - r)):
+        for sy, dy in ((0, 0), (r + 1, h - r)):
+            out.blit(tile, (dx, dy), (sx, sy, r, r), flags)
+    edges = (((r, 0, 1, r), (r, 0, w - 2 * r, r)),
+             ((r, r + 1, 1, r), (r, h - r, w - 2 * r, r)),
+             ((0, r, r, 1), (0, r, r, h - 2 * r)),
+             ((r + 1, r, r, 1), (w - r, r, r, h - 2 * r)))
+    for src, dst in edges:
+        dst = pygame.Rect(dst)
+        out.blit(pygame.transform.scale(tile.subsurface(src), dst.size), dst.topleft, special_flags=flags)
+    out.fill(color, (r, r, w - 2 * r, h - 2 * r))
+    return out
+
+
+# box radius (px) of the game-over backdrop blur
+GAMEOVER_BLUR_RADIUS = 8
+
+
+def box_blur(surf, radius, dest_surface=None):
+    """
+    Return a box-blurred RGB copy of surf (same size, edges clamped), written
+    into dest_surface when one of the same size is given.
+    Uses pygame-ce's transform.box_blur when present. Otherwise numpy does it
+    separably: each axis is one cumsum plus a shifted difference, so the cost
+    per pixel does not depend on the radius.
+    """
+    if _ce_box_blur is not None:
+        return _ce_box_blur(surf, radius, dest_surface=dest_surface)
+    arr = pygame.surfarray.array3d(surf).astype(np.int32)
+    k = 2 * radius + 1
+    for axis in (0, 1):
+        pad = [(0, 0)] * 3
+        pad[axis] = (radius + 1, radius)
+        sums = np.pad(arr, pad, mode='edge').cumsum(axis=axis)
+        hi = [slice(None)] * 3
+        lo = [slice(None)] * 3
+        hi[axis] = slice(k, None)
+        lo[axis] = slice(None, -k)
+        arr = (sums[tuple(hi)] - sums[tuple(lo)]) // k
+    if dest_surface is not None:
+        pygame.surfarray.blit_array(dest_surface, arr.astype(np.uint8))
+        return dest_surface
+    return pygame.surfarray.make_surface(arr.astype(np.uint8))
+
+
+def to_display(surf, alpha=True):
+    # match the display pixel format once so later blits take the fast path
+    try:
+        return surf.convert_alpha() if alpha else surf.convert()
+    except pygame.error:  # no display mode set yet
+        return surf
+
+
+def blit_batch(target, items, flags=0):
+    # one call for many (surface, pos) blits: pygame-ce fblits, else Surface.blits
+    fblits = getattr(target, 'fblits', None)
+    if fblits is not None:
+        fblits(items, flags)
+    else:
+        target.blits([(src, pos, None, flags) for src, pos in items], doreturn=False)
+
+
 # ====== Theme Manager ======
 class ThemeManager:
     def __init__(self):
@@ -109,50 +272,56 @@ class Button:
         self.callback = callback
         self.hover = False
         self.active = True
+        # rendered looks by _state_key(), each built on first use
+        self._cache = {}
+
+    def _state_key(self):
+        # everything the look depends on; position is applied at blit time
+        return self.rect.size, self.text, self.active, self.active and self.hover
+
+    def _render(self):
+        # each look is one surface; the drop shadow sits at (+2, +3)
+        w, h = self.rect.size
 
-    def draw(self, surf):
         if not self.active:
             # dimmed
-            base = pygame.Surface((self.rect.w, self.rect.h), pygame.SRCALPHA)
-            pygame.draw.rect(base, (200, 200, 200, 200), base.get_rect(), border_radius=self.radius)
-            surf.blit(base, self.rect.topleft)
+            disabled = pygame.Surface((w, h), pygame.SRCALPHA)
+            pygame.draw.rect(disabled, (200, 200, 200, 200), disabled.get_rect(), border_radius=self.radius)
             txt = self.font.render(self.text, True, (160, 160, 160))
-            surf.blit(txt, (self.rect.x + (self.rect.w - txt.get_width()) // 2,
-                            self.rect.y + (self.rect.h - txt.get_height()) // 2))
-            return
+            disabled.blit(txt, ((w - txt.get_width()) // 2, (h - txt.get_height()) // 2))
+            return to_display(disabled)
 
-        tmp = pygame.Surface((self.rect.w, self.rect.h), pygame.SRCALPHA)
         # gradient fill
-        for y in range(self.rect.h):
-            t = y / max(1, self.rect.h - 1)
-            c = self.color_a.lerp(self.color_b, t)
-            pygame.draw.line(tmp, c, (0, y), (self.rect.w, y))
+        face = vertical_gradient((w, h), self.color_a, self.color_b, alpha=True)
         # border radius
-        mask = pygame.Surface((self.rect.w, self.rect.h), pygame.SRCALPHA)
+        mask = pygame.Surface((w, h), pygame.SRCALPHA)
         pygame.draw.rect(mask, (255, 255, 255), mask.get_rect(), border_radius=self.radius)
-        tmp.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
-        
-        # subtle shadow
-        shadow = pygame.Surface((self.rect.w, self.rect.h), pygame.SRCALPHA)
-        pygame.draw.rect(shadow, (0, 0, 0, 30), shadow.get_rect(), border_radius=self.radius)
-        surf.blit(shadow, (self.rect.x + 2, self.rect.y + 3))
-        
-        # highlight on hover
+        face.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
+
         if self.hover:
-            highlight = pygame.Surface((self.rect.w, self.rect.h), pygame.SRCALPHA)
+            # highlight on hover
+            highlight = pygame.Surface((w, h), pygame.SRCALPHA)
             pygame.draw.rect(highlight, (255, 255, 255, 40), highlight.get_rect(), border_radius=self.radius)
-            tmp.blit(highlight, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
-            
-        surf.blit(tmp, self.rect.topleft)
-        
+            face.blit(highlight, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+
         # text with subtle shadow
         txt_shadow = self.font.render(self.text, True, (0, 0, 0, 30))
-        surf.blit(txt_shadow, (self.rect.x + (self.rect.w - txt_shadow.get_width()) // 2 + 1,
-                              self.rect.y + (self.rect.h - txt_shadow.get_height()) // 2 + 1))
-        
         txt = self.font.render(self.text, True, (255, 255, 255))
-        surf.blit(txt, (self.rect.x + (self.rect.w - txt.get_width()) // 2,
-                        self.rect.y + (self.rect.h - txt.get_height()) // 2))
+        look = pygame.Surface((w + 2, h + 3), pygame.SRCALPHA)
+        # subtle shadow
+        pygame.draw.rect(look, (0, 0, 0, 30), pygame.Rect(2, 3, w, h), border_radius=self.radius)
+        look.blit(face, (0, 0))
+        look.blit(txt_shadow, ((w - txt_shadow.get_width()) // 2 + 1,
+                               (h - txt_shadow.get_height()) // 2 + 1))
+        look.blit(txt, ((w - txt.get_width()) // 2, (h - txt.get_height()) // 2))
+        return to_display(look)
+
+    def surface(self):
+        key = self._state_key()
+        surf = self._cache.get(key)
+        if surf is None:
+            surf = self._cache[key] = self._render()
+        return surf
 
     def handle_event(self, event):
         if not self.active:
@@ -170,129 +339,192 @@ class Button:
 # ====== Board ======
 class Board:
     def __init__(self):
-        # 9 cells: None, 'X', 'O'
-        self.cells: List[Optional[str]] = [None] * 9
+        # bitboards: bit i set <=> cell i holds that mark
+        self.x_bb = 0
+        self.o_bb = 0
         # animations: dict idx -> {'start': timestamp, 'type': 'appear'}
         self.anim = {}
         self.winning_combo: Optional[Tuple[int, int, int]] = None
         self.win_anim_start = None
+        # static board look, rebuilt only when the board size changes
+        self.board_bg_cache = None
+        self.board_bg_size = None
+        self.hover_surf = None
+        self.win_cell_surf = None
+        # per-cell rects: inner rects board-local, hit/inner rects in screen space
+        self.cell_inner_rects: List[pygame.Rect] = []
+        self.cell_screen_rects: List[pygame.Rect] = []
+        self.cell_hit_rects: List[pygame.Rect] = []
+        self._rects_key = None
+        # screen areas changed by the last draw_items call, for display.update
+        self.dirty_rects: List[pygame.Rect] = []
+        self._drawn_key = None
+        self._hover_idx = None
 
     def reset(self):
-        self.cells = [None] * 9
+        self.x_bb = 0
+        self.o_bb = 0
         self.anim.clear()
         self.winning_combo = None
         self.win_anim_start = None
+        self.board_bg_size = None
 
     def place(self, idx: int, mark: str):
-        if 0 <= idx < 9 and self.cells[idx] is None:
-            self.cells[idx] = mark
+        if 0 <= idx < 9 and not self.is_occupied(idx):
+            if mark == PLAYER_X:
+                self.x_bb |= 1 << idx
+            else:
+                self.o_bb |= 1 << idx
             self.anim[idx] = {'start': pygame.time.get_ticks()}
             return True
         return False
 
+    def is_occupied(self, idx: int) -> bool:
+        return bool((self.x_bb | self.o_bb) >> idx & 1)
+
     def winner(self) -> Tuple[Optional[str], Optional[Tuple[int, int, int]]]:
-        for a, b, c in WIN_COMBINATIONS:
-            if self.cells[a] and self.cells[a] == self.cells[b] == self.cells[c]:
-                return self.cells[a], (a, b, c)
-        if all(c is not None for c in self.cells):
+        for mask, combo in zip(WIN_MASKS, WIN_COMBINATIONS):
+            if (self.x_bb & mask) == mask:
+                return PLAYER_X, combo
+            if (self.o_bb & mask) == mask:
+                return PLAYER_O, combo
+        if (self.x_bb | self.o_bb) == FULL_BOARD:
             return 'Draw', None
         return None, None
 
-    def is_cell_hover(self, idx, board_rect, cell_size, mouse_pos):
-        row = idx // 3
-        col = idx % 3
-        x = board_rect.x + col * cell_size
-        y = board_rect.y + row * cell_size
-        inner = pygame.Rect(x + 12, y + 12, int(cell_size) - 24, int(cell_size) - 24)
-        return inner.collidepoint(mouse_pos)
-
-    def draw(self, surf, board_rect: pygame.Rect, cell_size: int, fonts: dict,
-             theme: dict, mouse_pos, colors):
-        # board with subtle shadow
-        board_shadow = pygame.Surface((board_rect.w + 10, board_rect.h + 10), pygame.SRCALPHA)
-        pygame.draw.rect(board_shadow, (0, 0, 0, 40), board_shadow.get_rect(), border_radius=20)
-        surf.blit(board_shadow, (board_rect.x - 5, board_rect.y - 5))
-        
+    def update_rects(self, board_rect: pygame.Rect, cell_size: int):
+        # recomputed only when the board moves or is resized
+        key = (board_rect.x, board_rect.y, board_rect.w, cell_size)
+        if self._rects_key == key:
+            return
+        cs = int(cell_size)
+        self.cell_inner_rects = []
+        self.cell_screen_rects = []
+        self.cell_hit_rects = []
+        for i in range(9):
+            x = int((i % 3) * cell_size)
+            y = int((i // 3) * cell_size)
+            # Cell area (slightly smaller than the grid cell)
+            inner = pygame.Rect(x + 8, y + 8, cs - 16, cs - 16)
+            self.cell_inner_rects.append(inner)
+            self.cell_screen_rects.append(inner.move(board_rect.x, board_rect.y))
+            self.cell_hit_rects.append(pygame.Rect(board_rect.x + x, board_rect.y + y,
+                                                   int((i % 3 + 1) * cell_size) - x,
+                                                   int((i // 3 + 1) * cell_size) - y))
+        self._rects_key = key
+
+    def cell_at(self, board_rect, cell_size, pos) -> Optional[int]:
+        self.update_rects(board_rect, cell_size)
+        for i, r in enumerate(self.cell_hit_rects):
+            if r.collidepoint(pos):
+                return i
+        return None
+
+    def hover_cell_at(self, board_rect, cell_size, pos) -> Optional[int]:
+        # the inset rect draw_items highlights, not the full hit area of cell_at
+        self.update_rects(board_rect, cell_size)
+        for i, r in enumerate(self.cell_screen_rects):
+            if r.collidepoint(pos):
+                return i
+        return None
+
+    def _build_background(self, board_rect: pygame.Rect, cell_size: int, theme: dict):
+        # shadow, panel, grid and empty cells only change with the board size
+        w, h = board_rect.w, board_rect.h
+        bg = pygame.Surface((w + 10, h + 10), pygame.SRCALPHA)
+        pygame.draw.rect(bg, (0, 0, 0, 40), bg.get_rect(), border_radius=20)
+
         # MAIN BOARD SURFACE - WHITE BACKGROUND
-        board_surf = pygame.Surface((board_rect.w, board_rect.h), pygame.SRCALPHA)
+        board_surf = pygame.Surface((w, h), pygame.SRCALPHA)
         pygame.draw.rect(board_surf, (*theme['panel'][:3], 255), board_surf.get_rect(), border_radius=16)
 
         # BOLD GRID LINES - CLEARLY VISIBLE
         line_width = 6
         line_color = (*theme['line'][:3], 255)  # Solid gray lines
-        
+
         # Draw horizontal lines
         for r in range(1, 3):
             y = int(r * cell_size)
-            pygame.draw.line(board_surf, line_color, (10, y), (board_rect.w - 10, y), line_width)
-        
-        # Draw vertical lines  
+            pygame.draw.line(board_surf, line_color, (10, y), (w - 10, y), line_width)
+
+        # Draw vertical lines
         for c in range(1, 3):
             x = int(c * cell_size)
-            pygame.draw.line(board_surf, line_color, (x, 10), (x, board_rect.h - 10), line_width)
-
-        # draw cells
-        for i in range(9):
-            row = i // 3
-            col = i % 3
-            x = int(col * cell_size)
-            y = int(row * cell_size)
-            
-            # Cell area (slightly smaller than the grid cell)
-            cell_inner = pygame.Rect(x + 8, y + 8, int(cell_size) - 16, int(cell_size) - 16)
-            
-            # Create cell surface
-            cell_surf = pygame.Surface((cell_inner.w, cell_inner.h), pygame.SRCALPHA)
-            
-            # White cell background
-            pygame.draw.rect(cell_surf, (*theme['cell_top'][:3], 255), cell_surf.get_rect(), border_radius=10)
-
-            idx_global = i
-            mark = self.cells[idx_global]
+            pygame.draw.line(board_surf, line_color, (x, 10), (x, h - 10), line_width)
+
+        # White cell backgrounds (slightly smaller than the grid cell)
+        for cell_inner in self.cell_inner_rects:
+            pygame.draw.rect(board_surf, (*theme['cell_top'][:3], 255), cell_inner, border_radius=10)
+
+        bg.blit(board_surf, (5, 5))
+        # keeps per-pixel alpha: the shadow and rounded corners are not opaque
+        self.board_bg_cache = to_display(bg)
+
+        # hover highlight shared by all cells
+        inner = int(cell_size) - 16
+        self.hover_surf = pygame.Surface((inner, inner), pygame.SRCALPHA)
+        pygame.draw.rect(self.hover_surf, (*theme['glow'][:3], 30), self.hover_surf.get_rect(), border_radius=10)
+        self.hover_surf = to_display(self.hover_surf)
+
+        # winning cell highlight
+        self.win_cell_surf = pygame.Surface((inner, inner), pygame.SRCALPHA)
+        pygame.draw.rect(self.win_cell_surf, (*theme['glow'][:3], 40), self.win_cell_surf.get_rect(), border_radius=10)
+        self.win_cell_surf = to_display(self.win_cell_surf)
+
+    def draw_items(self, board_rect: pygame.Rect, cell_size: int, mark_frames: dict,
+                   theme: dict, mouse_pos):
+        """
+        Collect this frame's board blits as (surface, pos) pairs.
+        Returns (normal, additive); additive items use BLEND_RGBA_ADD.
+        """
+        self.update_rects(board_rect, cell_size)
+        dirty = self.dirty_rects = []
+        if self.board_bg_size != (board_rect.w, cell_size) or self._drawn_key != self._rects_key:
+            # new look or new place: the whole board including its shadow changed
+            self._build_background(board_rect, cell_size, theme)
+            self.board_bg_size = (board_rect.w, cell_size)
+            self._drawn_key = self._rects_key
+            dirty.append(board_rect.inflate(10, 10))
+        normal = [(self.board_bg_cache, (board_rect.x - 5, board_rect.y - 5))]
+        additive = []
+        hover_idx = None
+
+        # only marks and the hovered cell are drawn per frame
+        inner = int(cell_size) - 16
+        for i, cell in enumerate(self.cell_screen_rects):
+            mark = PLAYER_X if self.x_bb >> i & 1 else PLAYER_O if self.o_bb >> i & 1 else None
             if mark:
-                anim = self.anim.get(idx_global)
-                t = 1.0
+                # pre-rendered frames: pick the closest one while appearing
+                frames = mark_frames[mark]
+                mark_surf = frames[-1]
+                anim = self.anim.get(i)
                 if anim:
-                    elapsed = (pygame.time.get_ticks() - anim['start']) / 420.0
-                    t = min(max(elapsed, 0.0), 1.0)
-                alpha = int(255 * t)
-                scale = 0.6 + 0.4 * t
-                
-                # mark color mapping: X -> blue, O -> coral
-                if mark == PLAYER_X:
-                    color = colors['x']
-                    glow_col = colors['x_glow']
-                else:
-                    color = colors['o']
-                    glow_col = colors['o_glow']
-                    
-                # render text once at big size and scale
-                mark_surf = fonts['mark'].render(mark, True, color)
+                    elapsed = (pygame.time.get_ticks() - anim['start']) / MARK_ANIM_MS
+                    if elapsed < 1.0:
+                        mark_surf = frames[int(max(elapsed, 0.0) * (len(frames) - 1))]
+                    else:
+                        # last animated frame: present the full-size mark once more
+                        del self.anim[i]
+                    dirty.append(cell)
+
+                # Center the mark in the cell, clipped to the cell like before
                 mw, mh = mark_surf.get_size()
-                target_w = int(mw * scale)
-                target_h = int(mh * scale)
-                mark_surf = pygame.transform.smoothscale(mark_surf, (target_w, target_h))
-                mark_surf.set_alpha(alpha)
-                
-                # Center the mark in the cell
-                mark_x = (cell_inner.w - mark_surf.get_width()) // 2
-                mark_y = (cell_inner.h - mark_surf.get_height()) // 2
-                
-                # Draw the mark
-                cell_surf.blit(mark_surf, (mark_x, mark_y))
-
-            # hovered highlight if empty
-            hover = cell_inner.collidepoint(mouse_pos) and (mark is None)
-            if hover:
-                highlight = pygame.Surface((cell_inner.w, cell_inner.h), pygame.SRCALPHA)
-                pygame.draw.rect(highlight, (*theme['glow'][:3], 30), highlight.get_rect(), border_radius=10)
-                cell_surf.blit(highlight, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
-
-            # Draw the cell onto the board
-            board_surf.blit(cell_surf, (x + 8, y + 8))
-
-        # blit board_surf onto main surface
-        surf.blit(board_surf, board_rect.topleft)
+                off_x = (inner - mw) // 2
+                off_y = (inner - mh) // 2
+                if off_x < 0 or off_y < 0:
+                    area = pygame.Rect(max(0, -off_x), max(0, -off_y), min(mw, inner), min(mh, inner))
+                    mark_surf = mark_surf.subsurface(area)
+                normal.append((mark_surf, (cell.x + max(0, off_x), cell.y + max(0, off_y))))
+            elif cell.collidepoint(mouse_pos):
+                # hovered highlight if empty
+                additive.append((self.hover_surf, cell.topleft))
+                hover_idx = i
+
+        if hover_idx != self._hover_idx:
+            for idx in (self._hover_idx, hover_idx):
+                if idx is not None:
+                    dirty.append(self.cell_screen_rects[idx])
+            self._hover_idx = hover_idx
 
         # winning animation overlay
         if self.winning_combo:
@@ -308,21 +540,21 @@ class Board:
             # pulsing width and alpha
             width = int(8 + 6 * math.sin(elapsed * 8))
             alpha = int(180 + 40 * math.sin(elapsed * 3))
-            line_surf = pygame.Surface((surf.get_width(), surf.get_height()), pygame.SRCALPHA)
-            pygame.draw.line(line_surf, (*theme['glow'][:3], max(0, alpha)), (ax, ay), (cx, cy), width)
-            surf.blit(line_surf, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
-            
+            # only allocate the line's bounding box, not a full-screen layer
+            pad = width + 2
+            left, top = min(ax, cx) - pad, min(ay, cy) - pad
+            line_surf = pygame.Surface((abs(cx - ax) + 2 * pad, abs(cy - ay) + 2 * pad), pygame.SRCALPHA)
+            pygame.draw.line(line_surf, (*theme['glow'][:3], max(0, alpha)), (ax - left, ay - top),
+                             (cx - left, cy - top), width)
+            additive.append((line_surf, (left, top)))
+            dirty.append(line_surf.get_rect(topleft=(left, top)))
+
             # highlight winning cells
             for idx in self.winning_combo:
-                row = idx // 3
-                col = idx % 3
-                x = int(board_rect.x + col * cell_size + 8)
-                y = int(board_rect.y + row * cell_size + 8)
-                w = int(cell_size) - 16
-                h = int(cell_size) - 16
-                highlight = pygame.Surface((w, h), pygame.SRCALPHA)
-                pygame.draw.rect(highlight, (*theme['glow'][:3], 40), highlight.get_rect(), border_radius=10)
-                surf.blit(highlight, (x, y), special_flags=pygame.BLEND_RGBA_ADD)
+                additive.append((self.win_cell_surf, self.cell_screen_rects[idx].topleft))
+                dirty.append(self.cell_screen_rects[idx])
+
+        return normal, additive
 
 
 # ====== AI ======
@@ -331,71 +563,154 @@ class AI:
         self.ai_mark = ai_mark
         self.human_mark = human_mark
         self.difficulty = difficulty  # 'Easy', 'Medium', 'Impossible'
+        # transposition table: key -> (value, remaining depth, flag, move)
+        self.tt = {}
+        # solved 'Impossible' policy: (x_bb, o_bb) -> move, set by precompute_policy
+        self.policy = None
 
-    def best_move(self, cells: List[Optional[str]]) -> Optional[int]:
+    def best_move(self, x_bb: int, o_bb: int) -> Optional[int]:
         # choose strategy based on difficulty
-        available = [i for i, c in enumerate(cells) if c is None]
-        if not available:
+        empties = ~(x_bb | o_bb) & FULL_BOARD
+        if not empties:
             return None
         if self.difficulty == 'Easy':
-            return random.choice(available)
+            return random.choice([i for i in range(9) if empties >> i & 1])
         if self.difficulty == 'Medium':
             # attempt best with depth-limited minimax, but occasionally randomize
+            available = [i for i in range(9) if empties >> i & 1]
             if random.random() < 0.35:
                 return random.choice(available)
-            _, move = self._minimax(cells[:], True, -9999, 9999, 0, max_depth=4)
+            move = self._search(x_bb, o_bb, max_depth=4)
             return move if move is not None else random.choice(available)
-        # Impossible: full minimax
-        _, move = self._minimax(cells[:], True, -9999, 9999, 0, max_depth=9)
+        # Impossible: solved policy lookup once available, else full minimax
+        if self.policy is not None:
+            move = self.policy.get((x_bb, o_bb))
+            if move is not None:
+                return move
+        return self._search(x_bb, o_bb, max_depth=9)
+
+    def _search(self, x_bb: int, o_bb: int, max_depth: int) -> Optional[int]:
+        # iterative deepening: each pass fills the TT that orders the next one,
+        # and the best move so far is kept if the time budget runs out
+        start = time.perf_counter()
+        empty_count = 9 - bin(x_bb | o_bb).count('1')
+        move = None
+        for depth in range(1, max_depth + 1):
+            _, best = self._minimax(x_bb, o_bb, True, -9999, 9999, 0, depth)
+            if best is not None:
+                move = best
+            if depth >= empty_count or time.perf_counter() - start > AI_TIME_BUDGET:
+                break
         return move
 
-    def _minimax(self, board: List[Optional[str]], is_max: bool, alpha: int, beta: int, depth: int, max_depth: int) -> Tuple[int, Optional[int]]:
-        w = self._check_winner(board)
+    def precompute_policy(self):
+        # solve every reachable position with the AI to move; the dict is only
+        # published once complete so best_move never sees a partial policy
+        ai_is_x = self.ai_mark == PLAYER_X
+        policy = {}
+        seen = set()
+        stack = [(0, 0)]
+        while stack:
+            x_bb, o_bb = stack.pop()
+            if (x_bb, o_bb) in seen or self._check_winner(x_bb, o_bb) is not None:
+                continue
+            seen.add((x_bb, o_bb))
+            x_to_move = bin(x_bb).count('1') == bin(o_bb).count('1')
+            if x_to_move == ai_is_x:
+                _, move = self._minimax(x_bb, o_bb, True, -9999, 9999, 0, max_depth=9)
+                policy[(x_bb, o_bb)] = move
+            empties = ~(x_bb | o_bb) & FULL_BOARD
+            for i in range(9):
+                bit = 1 << i
+                if empties & bit:
+                    stack.append((x_bb | bit, o_bb) if x_to_move else (x_bb, o_bb | bit))
+        self.policy = policy
+
+    def _minimax(self, x_bb: int, o_bb: int, is_max: bool, alpha: int, beta: int, depth: int, max_depth: int) -> Tuple[int, Optional[int]]:
+        # scores use plies on the board rather than search depth so cached
+        # values stay valid across moves (root ordering is unchanged)
+        plies = bin(x_bb | o_bb).count('1')
+        w = self._check_winner(x_bb, o_bb)
         if w == self.ai_mark:
-            return 100 - depth, None
+            return 100 - plies, None
         if w == self.human_mark:
-            return -100 + depth, None
+            return -100 + plies, None
         if w == 'Draw':
             return 0, None
         if depth >= max_depth:
             return 0, None
 
+        # a search as deep as the empty squares is complete, whatever max_depth was
+        remaining = min(max_depth - depth, 9 - plies)
+        key = (x_bb << 9) | o_bb | (is_max << 18)
+        entry = self.tt.get(key)
+        if entry is not None and entry[1] >= remaining:
+            # bounds only cut off; narrowing the window with them would make the
+            # stored best move unreliable for an exact entry reused at the root
+            value, _, flag, move = entry
+            if flag == TT_EXACT:
+                return value, move
+            if flag == TT_LOWER and value >= beta:
+                return value, move
+            if flag == TT_UPPER and value <= alpha:
+                return value, move
+        alpha_orig, beta_orig = alpha, beta
+
+        # boards are passed by value, so there is nothing to undo after a child
+        x_to_move = is_max == (self.ai_mark == PLAYER_X)
+        order = MOVE_ORDER if entry is None or entry[3] is None else MOVE_ORDER_FROM[entry[3]]
+        empties = ~(x_bb | o_bb) & FULL_BOARD
         if is_max:
             best_val = -9999
             best_move = None
-            for i in range(9):
-                if board[i] is None:
-                    board[i] = self.ai_mark
-                    val, _ = self._minimax(board, False, alpha, beta, depth + 1, max_depth)
-                    board[i] = None
-                    if val > best_val:
-                        best_val = val
-                        best_move = i
-                    alpha = max(alpha, best_val)
-                    if beta <= alpha:
-                        break
-            return best_val, best_move
+            for i in order:
+                bit = 1 << i
+                if not empties & bit:
+                    continue
+                if x_to_move:
+                    val, _ = self._minimax(x_bb | bit, o_bb, False, alpha, beta, depth + 1, max_depth)
+                else:
+                    val, _ = self._minimax(x_bb, o_bb | bit, False, alpha, beta, depth + 1, max_depth)
+                if val > best_val:
+                    best_val = val
+                    best_move = i
+                alpha = max(alpha, best_val)
+                if beta <= alpha:
+                    break
         else:
             best_val = 9999
             best_move = None
-            for i in range(9):
-                if board[i] is None:
-                    board[i] = self.human_mark
-                    val, _ = self._minimax(board, True, alpha, beta, depth + 1, max_depth)
-                    board[i] = None
-                    if val < best_val:
-                        best_val = val
-                        best_move = i
-                    beta = min(beta, best_val)
-                    if beta <= alpha:
-                        break
-            return best_val, best_move
-
-    def _check_winner(self, board: List[Optional[str]]) -> Optional[str]:
-        for a, b, c in WIN_COMBINATIONS:
-            if board[a] and board[a] == board[b] == board[c]:
-                return board[a]
-        if all(cell is not None for cell in board):
+            for i in order:
+                bit = 1 << i
+                if not empties & bit:
+                    continue
+                if x_to_move:
+                    val, _ = self._minimax(x_bb | bit, o_bb, True, alpha, beta, depth + 1, max_depth)
+                else:
+                    val, _ = self._minimax(x_bb, o_bb | bit, True, alpha, beta, depth + 1, max_depth)
+                if val < best_val:
+                    best_val = val
+                    best_move = i
+                beta = min(beta, best_val)
+                if beta <= alpha:
+                    break
+
+        if best_val <= alpha_orig:
+            flag = TT_UPPER
+        elif best_val >= beta_orig:
+            flag = TT_LOWER
+        else:
+            flag = TT_EXACT
+        self.tt[key] = (best_val, remaining, flag, best_move)
+        return best_val, best_move
+
+    def _check_winner(self, x_bb: int, o_bb: int) -> Optional[str]:
+        for mask in WIN_MASKS:
+            if (x_bb & mask) == mask:
+                return PLAYER_X
+            if (o_bb & mask) == mask:
+                return PLAYER_O
+        if (x_bb | o_bb) == FULL_BOARD:
             return 'Draw'
         return None
 
@@ -411,7 +726,7 @@ class Game:
             pass
         self.width = width
         self.height = height
-        self.screen = pygame.display.set_mode((width, height), pygame.RESIZABLE)
+        self.screen = pygame.display.set_mode((width, height), DISPLAY_FLAGS)
         pygame.display.set_caption("Tic Tac Toe - Light Edition")
         self.clock = pygame.time.Clock()
         self.running = True
@@ -423,13 +738,18 @@ class Game:
         self.font_mark = pygame.font.SysFont('Segoe UI', 140, bold=True)
         self.font_button = pygame.font.SysFont('Segoe UI', 22, bold=True)
 
-        # theme manager
+        # theme manager; the active theme and what is rendered from it are set in _on_theme_change
         self.theme_mgr = ThemeManager()
+        self._theme = None
+        self._turn_surfs = {}
+        self.mark_frames = {}
 
         # board & AI
         self.board = Board()
         self.current_player = PLAYER_X
         self.ai = AI(ai_mark=PLAYER_O, human_mark=PLAYER_X, difficulty='Impossible')
+        # solve the game in the background; best_move falls back to live search until done
+        threading.Thread(target=self.ai.precompute_policy, daemon=True).start()
 
         # sounds
         self.snd_click = make_tone(880, 0.04, 0.12)
@@ -454,6 +774,9 @@ class Game:
 
         # UI elements: created in setup_ui
         self.ui_buttons = []
+        # layout is cached and only recomputed when marked dirty (resize / new menu)
+        self._layout_cache = None
+        self._layout_dirty = True
         self.setup_menu_ui()
 
         # restart/change mode buttons (bottom)
@@ -464,12 +787,76 @@ class Game:
 
         self.last_resize = (self.width, self.height)
 
-        # AI scheduling
+        # display presentation: full flips except for steady frames of the same screen,
+        # which only push the rects that changed (see run)
+        self._full_redraw = True
+        self._presented_mode = None
+        self._turn_rect = None
+        self._turn_drawn = None
+        self._buttons_drawn = None
+        # frames are only drawn on input, state changes and animation (see run)
+        self._needs_redraw = True
+        self._hover_drawn = None
+
+        # AI scheduling: the search runs on a worker so the render loop keeps drawing
         self.ai_delay_until = 0
+        self._ai_executor = ThreadPoolExecutor(max_workers=1)
+        self._ai_future = None
+        self._ai_board = None
+
+        # background gradient + dot pattern, rebuilt only on resize
+        self.bg_cache = None
+        self.bg_size = None
+        self.pattern_cache = None
+        self.pattern_size = None
+        # static layer under every frame: background, title and score panel
+        # (menu: subtitle), keyed by what it shows
+        self._background = None
+        self._background_key = None
+
+        # game-over backdrop: blurred snapshot of the last board frame, taken once
+        self._blur_cache = None
+        self._blur_cache_size = None
+        # blur output buffers, reused across game overs and reallocated on resize
+        self._blur_buf = None
+        self._small_buf = None
+        # result titles by (winner, vs_ai, theme) and the composed modal for this game over
+        self._title_cache = {}
+        self._modal_cache = None
+        # settled game-over frame (scene, blur and modal) without the buttons on top
+        self._gameover_composed = None
+        # modal decorations only depend on the fixed modal size
+        mw, mh = 500, 200
+        self._modal_shadow = to_display(rounded_rect_surface((mw + 10, mh + 10), (0, 0, 0, 80), 18))
+        self._modal_bg = to_display(rounded_rect_surface((mw, mh), (255, 255, 255, 240), 16))
+
+        self._on_theme_change()
+
+    def _on_theme_change(self):
+        # refresh everything derived from the palette; call again after switching theme_mgr.mode
+        self._theme = self.theme_mgr.theme()
+        # mark glyphs rendered once per theme (X -> blue, O -> coral), incl. appear animation frames
+        self.mark_frames = {
+            PLAYER_X: build_mark_frames(self.font_mark, PLAYER_X, self.theme_mgr.primary),
+            PLAYER_O: build_mark_frames(self.font_mark, PLAYER_O, self.theme_mgr.secondary)
+        }
+        # the turn label only ever shows one of three names
+        self._turn_surfs = {name: to_display(self.font_sub.render(f"Turn: {name}", True, self.theme_mgr.dark_gray))
+                            for name in ("You", "AI", "Player 2")}
+        self._title_cache.clear()
+        self._modal_cache = None
+        self._blur_cache = None
+        self._gameover_composed = None
+        self.bg_size = None
+        self._background_key = None
+        self.board.board_bg_size = None
+        self._full_redraw = True
+        self._needs_redraw = True
 
     def setup_menu_ui(self):
         # Buttons for menu - simplified with only two main options
         self.ui_buttons = []
+        self._layout_dirty = True
         
         # Player vs Player
         def set_pvp():
@@ -500,6 +887,9 @@ class Game:
 
     def reset_game(self):
         self.board.reset()
+        self.ai.tt.clear()
+        # a search still running belongs to the old board; its result is dropped
+        self._ai_future = None
         self.current_player = PLAYER_X
         self.game_over_reset()
 
@@ -511,6 +901,12 @@ class Game:
         self.mode = 'playing'
 
     def compute_layout(self):
+        if self._layout_dirty or self._layout_cache is None:
+            self._layout_cache = self._compute_layout()
+            self._layout_dirty = False
+        return self._layout_cache
+
+    def _compute_layout(self):
         w, h = self.screen.get_size()
         
         # Board layout - properly centered
@@ -542,6 +938,9 @@ class Game:
         w, combo = self.board.winner()
         if w is not None:
             self.mode = 'gameover'
+            self._blur_cache = None
+            self._modal_cache = None
+            self._gameover_composed = None
             self.winner = w
             self.winning_combo = combo
             self.board.winning_combo = combo
@@ -568,16 +967,9 @@ class Game:
     def handle_click_board(self, mouse_pos, board_rect, cell_size):
         if self.mode != 'playing':
             return
-        # compute col/row
-        if not board_rect.collidepoint(mouse_pos):
-            return
-        local_x = mouse_pos[0] - board_rect.x
-        local_y = mouse_pos[1] - board_rect.y
-        col = int(local_x // cell_size)
-        row = int(local_y // cell_size)
-        idx = row * 3 + col
-        if 0 <= idx < 9:
-            if self.board.cells[idx] is None:
+        idx = self.board.cell_at(board_rect, cell_size, mouse_pos)
+        if idx is not None:
+            if not self.board.is_occupied(idx):
                 # place for current player (human)
                 placed = self.board.place(idx, self.current_player)
                 if placed:
@@ -603,9 +995,19 @@ class Game:
             return
         if self.current_player != PLAYER_O:
             return
-        if pygame.time.get_ticks() < getattr(self, 'ai_delay_until', 0):
+        if self._ai_future is None:
+            if pygame.time.get_ticks() < getattr(self, 'ai_delay_until', 0):
+                return
+            self._ai_board = (self.board.x_bb, self.board.o_bb)
+            self._ai_future = self._ai_executor.submit(self.ai.best_move, *self._ai_board)
+            return
+        # poll once per frame until the worker has a move
+        if not self._ai_future.done():
+            return
+        future, self._ai_future = self._ai_future, None
+        if self._ai_board != (self.board.x_bb, self.board.o_bb):
             return
-        move = self.ai.best_move(self.board.cells[:])
+        move = future.result()
         if move is not None:
             self.board.place(move, PLAYER_O)
             if self.snd_place:
@@ -618,23 +1020,25 @@ class Game:
         if self.mode != 'gameover':
             self.current_player = PLAYER_X
 
-    def draw_background(self):
-        th = self.theme_mgr.theme()
+    def background_items(self):
+        th = self._theme
         w, h = self.screen.get_size()
-        # gradient background
-        for y in range(h):
-            t = y / max(1, h - 1)
-            c = th['bg_a'].lerp(th['bg_b'], t)
-            pygame.draw.line(self.screen, c, (0, y), (w, y))
-            
-        # Add subtle pattern
-        pattern = pygame.Surface((w, h), pygame.SRCALPHA)
-        for i in range(0, w, 40):
-            for j in range(0, h, 40):
-                pygame.draw.circle(pattern, (255, 255, 255, 5), (i, j), 1)
-        self.screen.blit(pattern, (0, 0))
-
-    def draw_title(self):
+        if self.pattern_size != (w, h):
+            # Add subtle pattern
+            self.pattern_cache = pygame.Surface((w, h), pygame.SRCALPHA)
+            for i in range(0, w, 40):
+                for j in range(0, h, 40):
+                    pygame.draw.circle(self.pattern_cache, (255, 255, 255, 5), (i, j), 1)
+            self.pattern_cache = to_display(self.pattern_cache)
+            self.pattern_size = (w, h)
+        if self.bg_size != (w, h):
+            # gradient background with the pattern baked in: one blit per frame
+            self.bg_cache = to_display(vertical_gradient((w, h), th['bg_a'], th['bg_b']), alpha=False)
+            self.bg_cache.blit(self.pattern_cache, (0, 0))
+            self.bg_size = (w, h)
+        return [(self.bg_cache, (0, 0))]
+
+    def title_items(self):
         w, h = self.screen.get_size()
         title_text = "Tic Tac Toe"
         # subtle color
@@ -644,12 +1048,11 @@ class Game:
         # Add subtle shadow
         shadow_surf = self.font_title.render(title_text, True, (0, 0, 0, 30))
         x = (w - title_surf.get_width()) // 2
-        self.screen.blit(shadow_surf, (x + 2, 32))
-        self.screen.blit(title_surf, (x, 30))
+        return [(shadow_surf, (x + 2, 32)), (title_surf, (x, 30))]
 
-    def draw_scoreboard(self):
+    def scoreboard_items(self):
         w, h = self.screen.get_size()
-        th = self.theme_mgr.theme()
+        th = self._theme
         sb_w, sb_h = 360, 50
         sb_x = (w - sb_w) // 2
         sb_y = h - 130
@@ -657,7 +1060,6 @@ class Game:
         # Shadow
         sb_shadow = pygame.Surface((sb_w + 6, sb_h + 6), pygame.SRCALPHA)
         pygame.draw.rect(sb_shadow, (0, 0, 0, 30), sb_shadow.get_rect(), border_radius=14)
-        self.screen.blit(sb_shadow, (sb_x - 3, sb_y - 3))
         
         # Main panel
         sb = pygame.Surface((sb_w, sb_h), pygame.SRCALPHA)
@@ -669,11 +1071,97 @@ class Game:
         sb.blit(ptxt, (20, 14))
         sb.blit(aitxt, (140, 14))
         sb.blit(dtxt, (220, 14))
-        self.screen.blit(sb, (sb_x, sb_y))
+        return [(sb_shadow, (sb_x - 3, sb_y - 3)), (sb, (sb_x, sb_y))]
+
+    def _get_blur(self):
+        size = self.screen.get_size()
+        if self._blur_cache is None or self._blur_cache_size != size:
+            if self._blur_buf is None or self._blur_buf.get_size() != size:
+                self._blur_buf = to_display(pygame.Surface(size), alpha=False)
+                self._blur_buf.set_alpha(180)
+            if _ce_box_blur is not None or np is not None:
+                box_blur(self.screen, GAMEOVER_BLUR_RADIUS, self._blur_buf)
+            else:
+                small = (max(1, size[0] // 12), max(1, size[1] // 12))
+                if self._small_buf is None or self._small_buf.get_size() != small:
+                    self._small_buf = to_display(pygame.Surface(small), alpha=False)
+                # smoothscale only reads its source, so the screen is passed as is
+                pygame.transform.smoothscale(self.screen, self._small_buf.get_size(), self._small_buf)
+                # the thumbnail is already blurry, so the cheap unfiltered scale is enough going up
+                pygame.transform.scale(self._small_buf, size, self._blur_buf)
+            self._blur_cache = self._blur_buf
+            self._blur_cache_size = size
+        return self._blur_cache
+
+    def _modal_title(self):
+        key = (self.winner, self.vs_ai, id(self._theme))
+        ts = self._title_cache.get(key)
+        if ts is None:
+            if self.winner == PLAYER_X:
+                title = "You Win!" if not self.vs_ai else "Player Wins!"
+                color = self.theme_mgr.primary
+            elif self.winner == PLAYER_O:
+                title = "AI Wins!" if self.vs_ai else "Player 2 Wins!"
+                color = self.theme_mgr.secondary
+            else:
+                title = "It's a Draw!"
+                color = self.theme_mgr.accent
+            ts = self._title_cache[key] = to_display(self.font_title.render(title, True, color))
+        return ts
+
+    def _get_modal(self):
+        # panel with the result title, composed once per game over
+        if self._modal_cache is None:
+            modal = self._modal_bg.copy()
+            ts = self._modal_title()
+            modal.blit(ts, ((modal.get_width() - ts.get_width()) // 2, 40))
+            self._modal_cache = modal
+        return self._modal_cache
+
+    def menu_subtitle_items(self):
+        w, h = self.screen.get_size()
+        subtitle = self.font_sub.render("Select Game Mode", True, self.theme_mgr.dark_gray)
+        return [(subtitle, ((w - subtitle.get_width()) // 2, self.ui_buttons[0].rect.y - 60))]
+
+    def background_layer(self):
+        # everything that stays put until the window, screen, score or theme changes
+        w, h = self.screen.get_size()
+        in_menu = self.mode == 'menu'
+        key = (w, h, in_menu, tuple(self.scores.values()), id(self._theme))
+        if key != self._background_key:
+            layer = to_display(pygame.Surface((w, h)), alpha=False)
+            items = self.background_items() + self.title_items()
+            items += self.menu_subtitle_items() if in_menu else self.scoreboard_items()
+            blit_batch(layer, items)
+            self._background = layer
+            self._background_key = key
+            # the whole screen may differ from what was presented
+            self._full_redraw = True
+        return self._background
+
+    @staticmethod
+    def button_items(buttons):
+        # cached looks of a set of buttons, blitted together with the rest of the frame
+        return [(b.surface(), b.rect.topleft) for b in buttons]
+
+    def footer_button_items(self):
+        return self.button_items((self.btn_restart, self.btn_change_mode))
+
+    def _is_animating(self):
+        # the screen changes on its own while marks appear, a win line pulses
+        # or the AI is about to move; a composed game over is frozen
+        if self.mode == 'menu' or (self.mode == 'gameover' and self._gameover_composed is not None):
+            return False
+        ai_pending = self.mode == 'playing' and self.vs_ai and self.current_player == PLAYER_O
+        return bool(self.board.anim) or self.board.winning_combo is not None or ai_pending
 
-    def draw_footer_buttons(self):
-        self.btn_restart.draw(self.screen)
-        self.btn_change_mode.draw(self.screen)
+    def _hover_key(self, mouse_pos):
+        # everything the pointer can highlight: the cell under it and the buttons
+        if self.mode == 'menu':
+            return None, tuple(b.hover for b in self.ui_buttons)
+        board_rect, cell_size = self.compute_layout()
+        cell = self.board.hover_cell_at(board_rect, cell_size, mouse_pos) if self.mode == 'playing' else None
+        return cell, (self.btn_restart.hover, self.btn_change_mode.hover)
 
     def run(self):
         while self.screen is None:
@@ -681,12 +1169,27 @@ class Game:
             
         while self.running:
             dt = self.clock.tick(FPS)
+            if self._needs_redraw or self._is_animating():
+                events = pygame.event.get()
+            else:
+                # idle: block on the queue instead of spinning until input arrives
+                event = pygame.event.wait(IDLE_WAIT_MS)
+                events = [event] + pygame.event.get() if event.type != pygame.NOEVENT else []
             mouse_pos = pygame.mouse.get_pos()
-            for event in pygame.event.get():
+            for event in events:
+                if event.type != pygame.MOUSEMOTION:
+                    self._needs_redraw = True
                 if event.type == pygame.QUIT:
                     self.running = False
                 elif event.type == pygame.VIDEORESIZE:
-                    self.screen = pygame.display.set_mode(event.size, pygame.RESIZABLE)
+                    self.screen = pygame.display.set_mode(event.size, DISPLAY_FLAGS)
+                    self._layout_dirty = True
+                    self._full_redraw = True
+                    self._blur_cache = None
+                    self._gameover_composed = None
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED):
+                    # the OS may have dropped the window contents: present a full frame
+                    self._full_redraw = True
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         self.running = False
@@ -719,85 +1222,101 @@ class Game:
                 # AI tick
                 self.ai_turn()
 
-            # Draw pipeline
-            self.draw_background()
-            self.draw_title()
+            # pointer motion only needs a frame when it changes a highlight
+            hover_key = self._hover_key(mouse_pos)
+            if hover_key != self._hover_drawn:
+                self._needs_redraw = True
+            if not (self._needs_redraw or self._is_animating()):
+                continue
+            self._hover_drawn = hover_key
 
             # compute layout
             board_rect, cell_size = self.compute_layout()
 
+            # Draw pipeline: collect blits, then submit one batch per blend flag
+            composed = self._gameover_composed if self.mode == 'gameover' else None
+            base = composed if composed is not None else self.background_layer()
+            blit_list_normal = [(base, (0, 0))]
+            blit_list_add = []
+
             # UI elements
-            if self.mode == 'menu':
-                # Menu screen
-                for b in self.ui_buttons:
-                    b.draw(self.screen)
-                    
-                # Add subtitle
-                subtitle = self.font_sub.render("Select Game Mode", True, self.theme_mgr.dark_gray)
-                w, h = self.screen.get_size()
-                self.screen.blit(subtitle, ((w - subtitle.get_width()) // 2, 
-                                           self.ui_buttons[0].rect.y - 60))
+            if composed is not None:
+                # settled game over: only the buttons on top of the composed frame change
+                buttons = self.footer_button_items()
+                blit_list_normal += buttons
+                dirty_rects = []
+            elif self.mode == 'menu':
+                # Menu screen: only the buttons change on top of the background layer
+                buttons = self.button_items(self.ui_buttons)
+                blit_list_normal += buttons
+                dirty_rects = []
             else:
                 # Game screen
-                # scoreboard
-                self.draw_scoreboard()
                 # board
-                colors = {
-                    'x': self.theme_mgr.primary,
-                    'o': self.theme_mgr.secondary,
-                    'x_glow': self.theme_mgr.primary,
-                    'o_glow': self.theme_mgr.secondary
-                }
-                self.board.draw(self.screen, board_rect, cell_size, {'mark': self.font_mark}, self.theme_mgr.theme(),
-                                mouse_pos, colors)
+                board_normal, board_add = self.board.draw_items(board_rect, cell_size, self.mark_frames,
+                                                                self._theme, mouse_pos)
+                blit_list_normal += board_normal
+                blit_list_add += board_add
                 # footer buttons
-                self.draw_footer_buttons()
+                buttons = self.footer_button_items()
+                blit_list_normal += buttons
                 # show current turn
-                turn_text = f"Turn: {'You' if self.current_player == PLAYER_X else 'AI' if self.vs_ai else 'Player 2'}"
-                t_surf = self.font_sub.render(turn_text, True, self.theme_mgr.dark_gray)
-                self.screen.blit(t_surf, (20, 100))
+                t_surf = self._turn_surfs['You' if self.current_player == PLAYER_X else 'AI' if self.vs_ai else 'Player 2']
+                blit_list_normal.append((t_surf, (20, 100)))
+
+                # changed areas: board and the turn label when it switched
+                dirty_rects = list(self.board.dirty_rects)
+                if t_surf is not self._turn_drawn:
+                    turn_rect = t_surf.get_rect(topleft=(20, 100))
+                    dirty_rects.append(turn_rect.union(self._turn_rect) if self._turn_rect else turn_rect)
+                    self._turn_rect = turn_rect
+                    self._turn_drawn = t_surf
+
+            # buttons (with shadow) whose look changed
+            button_looks = tuple(src for src, _ in buttons)
+            if button_looks != self._buttons_drawn:
+                dirty_rects += [pygame.Rect(pos, src.get_size()) for src, pos in buttons]
+                self._buttons_drawn = button_looks
+
+            blit_batch(self.screen, blit_list_normal)
+            if blit_list_add:
+                blit_batch(self.screen, blit_list_add, pygame.BLEND_RGBA_ADD)
 
             # if gameover draw modal
-            if self.mode == 'gameover':
-                # blur snapshot
-                snap = self.screen.copy()
-                small = pygame.transform.smoothscale(snap, (max(1, self.screen.get_width() // 12), max(1, self.screen.get_height() // 12)))
-                blur = pygame.transform.smoothscale(small, self.screen.get_size())
-                blur.set_alpha(180)
-                self.screen.blit(blur, (0, 0))
+            if self.mode == 'gameover' and composed is None:
+                sw, sh = self.screen.get_size()
+                # the blur is taken once, after the last mark has finished appearing;
+                # until then the modal sits over the unblurred board
+                settled = not self.board.anim
+                if settled:
+                    # blur snapshot (cached until the next game over or resize)
+                    self.screen.blit(self._get_blur(), (0, 0))
                 
                 # modal box with shadow
-                mw, mh = 500, 200
-                mx = (self.screen.get_width() - mw) // 2
-                my = (self.screen.get_height() - mh) // 2
-                
-                modal_shadow = pygame.Surface((mw + 10, mh + 10), pygame.SRCALPHA)
-                pygame.draw.rect(modal_shadow, (0, 0, 0, 80), modal_shadow.get_rect(), border_radius=18)
-                self.screen.blit(modal_shadow, (mx - 5, my - 5))
-                
-                modal = pygame.Surface((mw, mh), pygame.SRCALPHA)
-                pygame.draw.rect(modal, (255, 255, 255, 240), modal.get_rect(), border_radius=16)
-                # title
-                if self.winner == PLAYER_X:
-                    title = "You Win!" if not self.vs_ai else "Player Wins!"
-                    color = self.theme_mgr.primary
-                elif self.winner == PLAYER_O:
-                    title = "AI Wins!" if self.vs_ai else "Player 2 Wins!"
-                    color = self.theme_mgr.secondary
-                else:
-                    title = "It's a Draw!"
-                    color = self.theme_mgr.accent
-                    
-                ts = self.font_title.render(title, True, color)
-                modal.blit(ts, ((mw - ts.get_width()) // 2, 40))
-                self.screen.blit(modal, (mx, my))
+                mw, mh = self._modal_bg.get_size()
+                mx = (sw - mw) // 2
+                my = (sh - mh) // 2
+                self.screen.blit(self._modal_shadow, (mx - 5, my - 5))
+                self.screen.blit(self._get_modal(), (mx, my))
+                if settled:
+                    # later frames blit this and redraw only the buttons
+                    self._gameover_composed = self.screen.copy()
+                    self._full_redraw = True
                 
                 # draw restart/change mode buttons on modal area
-                self.btn_restart.draw(self.screen)
-                self.btn_change_mode.draw(self.screen)
+                blit_batch(self.screen, buttons)
 
-            pygame.display.flip()
+            # same screen as last presented: push only what changed (the blur and modal are static)
+            if self._presented_mode == self.mode and not self._full_redraw:
+                if dirty_rects:
+                    pygame.display.update(dirty_rects)
+            else:
+                pygame.display.flip()
+            self._presented_mode = self.mode
+            self._full_redraw = False
+            self._needs_redraw = False
 
+        self._ai_executor.shutdown(wait=False)
         pygame.quit()
         sys.exit()
 